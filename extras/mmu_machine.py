@@ -265,6 +265,7 @@ class MmuToolHead(toolhead.ToolHead, object):
     EXTRUDER_SYNCED_TO_GEAR = 1 # Aka 'gear+extruder'
     EXTRUDER_ONLY_ON_GEAR   = 2 # Aka 'extruder' (only)
     GEAR_SYNCED_TO_EXTRUDER = 3 # Aka 'extruder+gear'
+    EXTRUDER_ON_GEAR_MODES  = (EXTRUDER_SYNCED_TO_GEAR, EXTRUDER_ONLY_ON_GEAR) # Modes where extruder is driven by gear rail
 
     def __init__(self, config, mmu):
         self.mmu = mmu
@@ -355,7 +356,8 @@ class MmuToolHead(toolhead.ToolHead, object):
         # Create MMU kinematics
         try:
             self.kin = MmuKinematics(self, config)
-            self.all_gear_rail_steppers = self.kin.rails[1].get_steppers()
+            self.gear_rail = self.kin.rails[1]
+            self.all_gear_rail_steppers = self.gear_rail.get_steppers()
         except config.error:
             raise
         except self.printer.lookup_object('pins').error:
@@ -369,7 +371,7 @@ class MmuToolHead(toolhead.ToolHead, object):
         self.mmu_extruder_stepper = None
         if self.mmu_machine.homing_extruder:
             # Create MmuExtruderStepper for later insertion into PrinterExtruder on Toolhead (on klippy:connect)
-            self.mmu_extruder_stepper = MmuExtruderStepper(config.getsection('extruder'), self.kin.rails[1]) # Only first extruder is handled
+            self.mmu_extruder_stepper = MmuExtruderStepper(config.getsection('extruder'), self.gear_rail) # Only first extruder is handled
 
             # Nullify original extruder stepper definition so Klipper doesn't try to create it again. Restore in handle_connect()
             self.old_ext_options = {}
@@ -407,8 +409,8 @@ class MmuToolHead(toolhead.ToolHead, object):
     # Ensure the correct number of axes for convenience - MMU only has two
     # Also, handle case when gear rail is synced to extruder
     def set_position(self, newpos, homing_axes=()):
-        for _ in range(4 - len(newpos)):
-            newpos.append(0.)
+        if len(newpos) < 4:
+            newpos = list(newpos) + [0.] * (4 - len(newpos))
         super(MmuToolHead, self).set_position(newpos, homing_axes)
 
     def get_selector_limits(self):
@@ -437,7 +439,7 @@ class MmuToolHead(toolhead.ToolHead, object):
             self.mmu_toolhead.flush_step_generation()
 
         # Activate only the desired gear steppers
-        gear_rail = self.get_kinematics().rails[1]
+        gear_rail = self.gear_rail
         pos = [0., self.mmu_toolhead.get_position()[1], 0.]
         gear_rail.steppers = []
 
@@ -450,6 +452,7 @@ class MmuToolHead(toolhead.ToolHead, object):
                 # Cripple unused/unwanted gear steppers
                 if s.generate_steps in self.mmu_toolhead.step_generators:
                     self.mmu_toolhead.step_generators.remove(s.generate_steps)
+        self.kin.update_steppers() # Refresh before any error so cached steppers match the rail
 
         if selected_steppers:
             if not gear_rail.steppers:
@@ -468,7 +471,7 @@ class MmuToolHead(toolhead.ToolHead, object):
 
     # Is extruder stepper synced to gear rail (general MMU synced movement)
     def is_extruder_synced_to_gear(self):
-        return self.sync_mode in [self.EXTRUDER_SYNCED_TO_GEAR, self.EXTRUDER_ONLY_ON_GEAR]
+        return self.sync_mode in self.EXTRUDER_ON_GEAR_MODES
 
     # Is gear rail synced to extruder (for in print syncing)
     def is_gear_synced_to_extruder(self):
@@ -479,13 +482,14 @@ class MmuToolHead(toolhead.ToolHead, object):
         prev_sync_mode = self.sync_mode
         self.unsync()
         if new_sync_mode is None: return prev_sync_mode # Lazy way to unsync()
-        self.mmu.log_stepper("sync(mode=%d %s)" % (new_sync_mode, ("gear+extruder" if new_sync_mode == self.EXTRUDER_SYNCED_TO_GEAR  else "extruder" if new_sync_mode == self.EXTRUDER_ONLY_ON_GEAR else "extruder+gear")))
+        if self.mmu.log_enabled(self.mmu.LOG_STEPPER):
+            self.mmu.log_stepper("sync(mode=%d %s)" % (new_sync_mode, ("gear+extruder" if new_sync_mode == self.EXTRUDER_SYNCED_TO_GEAR  else "extruder" if new_sync_mode == self.EXTRUDER_ONLY_ON_GEAR else "extruder+gear")))
         self.printer_toolhead.flush_step_generation()
         self.mmu_toolhead.flush_step_generation()
         self.mmu.movequeues_sync()
 
         ffi_main, ffi_lib = chelper.get_ffi()
-        if new_sync_mode in [self.EXTRUDER_SYNCED_TO_GEAR, self.EXTRUDER_ONLY_ON_GEAR]:
+        if new_sync_mode in self.EXTRUDER_ON_GEAR_MODES:
             driving_toolhead = self.mmu_toolhead
             following_toolhead = self.printer_toolhead
             following_steppers = [self.printer_toolhead.get_extruder().extruder_stepper.stepper]
@@ -496,17 +500,17 @@ class MmuToolHead(toolhead.ToolHead, object):
 
             # Cripple unused/unwanted gear steppers
             # Inject the extruder steppers into the gear rail
-            rail = self.mmu_toolhead.get_kinematics().rails[1]
+            rail = self.gear_rail
             if new_sync_mode == self.EXTRUDER_ONLY_ON_GEAR:
                 self.inactive_gear_steppers = list(rail.steppers)
-                for s in self.inactive_gear_steppers:
-                    self.mmu_toolhead.step_generators.remove(s.generate_steps)
+                self._remove_step_generators(self.mmu_toolhead, self.inactive_gear_steppers)
             rail.steppers.extend(following_steppers)
+            self.kin.update_steppers()
 
         elif new_sync_mode == self.GEAR_SYNCED_TO_EXTRUDER:
             driving_toolhead = self.printer_toolhead
             following_toolhead = self.mmu_toolhead
-            following_steppers = self.mmu_toolhead.get_kinematics().rails[1].get_steppers()
+            following_steppers = self.gear_rail.get_steppers()
             self._prev_trapq = self.mmu_toolhead.get_trapq()
             driving_trapq = self.printer_toolhead.get_extruder().get_trapq()
             s_alloc = ffi_lib.extruder_stepper_alloc()
@@ -516,11 +520,11 @@ class MmuToolHead(toolhead.ToolHead, object):
             raise ValueError("Invalid sync_mode: %d" % new_sync_mode)
 
         self._prev_sk, self._prev_rd = [], []
+        self._remove_step_generators(following_toolhead, following_steppers)
         for s in following_steppers:
             s_kinematics = ffi_main.gc(s_alloc, ffi_lib.free)
             self._prev_sk.append(s.set_stepper_kinematics(s_kinematics))
             self._prev_rd.append(s.get_rotation_distance()[0])
-            following_toolhead.step_generators.remove(s.generate_steps)
             driving_toolhead.register_step_generator(s.generate_steps)
             s.set_trapq(driving_trapq)
             s.set_position(pos)
@@ -532,13 +536,14 @@ class MmuToolHead(toolhead.ToolHead, object):
 
     def unsync(self):
         if self.sync_mode is None: return None
-        self.mmu.log_stepper("unsync()")
+        if self.mmu.log_enabled(self.mmu.LOG_STEPPER):
+            self.mmu.log_stepper("unsync()")
         prev_sync_mode = self.sync_mode
         self.printer_toolhead.flush_step_generation()
         self.mmu_toolhead.flush_step_generation()
         self.mmu.movequeues_sync()
 
-        if self.sync_mode in [self.EXTRUDER_SYNCED_TO_GEAR, self.EXTRUDER_ONLY_ON_GEAR]:
+        if self.sync_mode in self.EXTRUDER_ON_GEAR_MODES:
             driving_toolhead = self.mmu_toolhead
             following_toolhead = self.printer_toolhead
             following_steppers = [self.printer_toolhead.get_extruder().extruder_stepper.stepper]
@@ -546,27 +551,29 @@ class MmuToolHead(toolhead.ToolHead, object):
 
             # Restore previously unused/unwanted gear steppers
             # Remove extruder steppers from gear rail
-            rail = self.mmu_toolhead.get_kinematics().rails[1]
+            rail = self.gear_rail
             if self.sync_mode == self.EXTRUDER_ONLY_ON_GEAR: # I.e. self.inactive_gear_steppers is not None
+                gear_pos = [0., self.mmu_toolhead.get_position()[1], 0.]
                 for s in self.inactive_gear_steppers:
                     self.mmu_toolhead.register_step_generator(s.generate_steps)
-                    s.set_position([0., self.mmu_toolhead.get_position()[1], 0.])
+                    s.set_position(gear_pos)
                 self.inactive_gear_steppers = [] # python3 - self.inactive_gear_steppers.clear()
             rail.steppers = rail.steppers[:-len(following_steppers)]
+            self.kin.update_steppers()
 
         elif self.sync_mode == self.GEAR_SYNCED_TO_EXTRUDER:
             driving_toolhead = self.printer_toolhead
             following_toolhead = self.mmu_toolhead
-            following_steppers = self.mmu_toolhead.get_kinematics().rails[1].get_steppers()
+            following_steppers = self.gear_rail.get_steppers()
             pos = [0., self.mmu_toolhead.get_position()[1], 0.]
 
         else:
             raise ValueError("Invalid sync_mode: %d" % self.sync_mode)
 
+        self._remove_step_generators(driving_toolhead, following_steppers)
         for i, s in enumerate(following_steppers):
             s.set_stepper_kinematics(self._prev_sk[i])
             s.set_rotation_distance(self._prev_rd[i])
-            driving_toolhead.step_generators.remove(s.generate_steps)
             following_toolhead.register_step_generator(s.generate_steps)
             s.set_trapq(self._prev_trapq)
             s.set_position(pos)
@@ -576,16 +583,22 @@ class MmuToolHead(toolhead.ToolHead, object):
         self.sync_mode = None
         return prev_sync_mode
 
+    # Remove step generators of all 'steppers' from toolhead 'th' in a single pass. Like list.remove(),
+    # raises ValueError if any are not registered (indicates broken sync/unsync bookkeeping)
+    def _remove_step_generators(self, th, steppers):
+        handlers = set(s.generate_steps for s in steppers)
+        remaining = [sg for sg in th.step_generators if sg not in handlers]
+        if len(th.step_generators) - len(remaining) < len(handlers):
+            raise ValueError("Step generator not registered on toolhead")
+        th.step_generators[:] = remaining
+
     def is_selector_homed(self):
         return self.kin.get_status(self.reactor.monotonic())["selector_homed"]
 
     def get_status(self, eventtime):
-        res = super(MmuToolHead, self).get_status(eventtime)
-        res.update(dict(self.get_kinematics().get_status(eventtime)))
-        res.extend({
-            'filament_pos': self.mmu_toolhead.get_position()[1],
-            'sync_mode': self.sync_mode
-        })
+        res = super(MmuToolHead, self).get_status(eventtime) # Includes kinematics status
+        res['filament_pos'] = self.get_position()[1]
+        res['sync_mode'] = self.sync_mode
         return res
 
     cmd_DUMP_RAILS_help = "For debugging: dump current configuration of MMU Toolhead rails"
@@ -594,49 +607,52 @@ class MmuToolHead(toolhead.ToolHead, object):
         gcmd.respond_raw(msg)
 
     def dump_rails(self):
-        msg =  "MMU TOOLHEAD: %s\n" % self.get_position()
+        msg = ["MMU TOOLHEAD: %s\n" % self.get_position()]
         extruder_name = self.printer_toolhead.get_extruder().get_name()
         for axis, rail in enumerate(self.get_kinematics().rails):
-            msg += "\n" if axis > 0 else ""
+            if axis > 0:
+                msg.append("\n")
             header = "RAIL: %s (Steppers: %d, Default endstops: %d, Extra endstops: %d) %s" % (rail.rail_name, len(rail.steppers), len(rail.endstops), len(rail.extra_endstops), '-' * 100)
-            msg += header[:100] + "\n"
+            msg.append(header[:100] + "\n")
             for idx, s in enumerate(rail.get_steppers()):
-                msg += "Stepper %d: %s%s\n" % (idx, s.get_name(), "(INACTIVE)" if axis == 1 and s in self.inactive_gear_steppers else "")
-                msg += "- Commanded Pos: %.2f, " % s.get_commanded_position()
-                msg += "MCU Pos: %.2f, " % s.get_mcu_position()
                 rd = s.get_rotation_distance()
-                msg += "Rotation Dist: %.6f (in %d steps, step_dist=%.6f)\n" % (rd[0], rd[1], s.get_step_dist())
-            msg += "Endstops:\n"
+                msg.append("Stepper %d: %s%s\n" % (idx, s.get_name(), "(INACTIVE)" if axis == 1 and s in self.inactive_gear_steppers else ""))
+                msg.append("- Commanded Pos: %.2f, MCU Pos: %.2f, Rotation Dist: %.6f (in %d steps, step_dist=%.6f)\n" % (s.get_commanded_position(), s.get_mcu_position(), rd[0], rd[1], s.get_step_dist()))
+            msg.append("Endstops:\n")
             for (mcu_endstop, name) in rail.endstops:
                 if mcu_endstop.__class__.__name__ == "MockEndstop":
-                    msg += "- None (Mock - cannot home rail)\n"
+                    msg.append("- None (Mock - cannot home rail)\n")
                 else:
-                    msg += "- %s%s, mcu: %s, pin: %s" % (name," (virtual)" if rail.is_endstop_virtual(name) else "", mcu_endstop.get_mcu().get_name(), mcu_endstop._pin)
-                    msg += " on: %s\n" % ["%d: %s" % (idx, s.get_name()) for idx, s in enumerate(mcu_endstop.get_steppers())]
-            msg += "Extra Endstops:\n"
+                    msg.append(self._format_endstop(rail, mcu_endstop, name))
+            msg.append("Extra Endstops:\n")
             for (mcu_endstop, name) in rail.extra_endstops:
-                msg += "- %s%s, mcu: %s, pin: %s" % (name, " (virtual)" if rail.is_endstop_virtual(name) else "", mcu_endstop.get_mcu().get_name(), mcu_endstop._pin)
-                msg += " on: %s\n" % ["%d: %s" % (idx, s.get_name()) for idx, s in enumerate(mcu_endstop.get_steppers())]
+                msg.append(self._format_endstop(rail, mcu_endstop, name))
             if axis == 1: # Gear rail
                 if self.is_gear_synced_to_extruder():
-                    msg += "SYNCHRONIZED: Gear rail synced to extruder '%s'\n" % extruder_name
+                    msg.append("SYNCHRONIZED: Gear rail synced to extruder '%s'\n" % extruder_name)
                 if self.is_extruder_synced_to_gear():
-                    msg += "SYNCHRONIZED: Extruder '%s' synced to gear rail\n" % extruder_name
+                    msg.append("SYNCHRONIZED: Extruder '%s' synced to gear rail\n" % extruder_name)
 
         e_stepper = self.printer_toolhead.get_extruder().extruder_stepper
-        msg +=  "\nPRINTER TOOLHEAD: %s\n" % self.printer_toolhead.get_position()
+        msg.append("\nPRINTER TOOLHEAD: %s\n" % self.printer_toolhead.get_position())
         header = "Extruder Stepper: %s %s %s" % (extruder_name, "(MmuExtruderStepper)" if isinstance(e_stepper, MmuExtruderStepper) else "(Non Homing Default)", '-' * 100)
-        msg += header[:100] + "\n"
-        msg += "- Commanded Pos: %.2f, " % e_stepper.stepper.get_commanded_position()
-        msg += "MCU Pos: %.2f, " % e_stepper.stepper.get_mcu_position()
+        msg.append(header[:100] + "\n")
         rd = e_stepper.stepper.get_rotation_distance()
-        msg += "Rotation Dist: %.6f (in %d steps, step_dist=%.6f)\n" % (rd[0], rd[1], e_stepper.stepper.get_step_dist())
-        return msg
+        msg.append("- Commanded Pos: %.2f, MCU Pos: %.2f, Rotation Dist: %.6f (in %d steps, step_dist=%.6f)\n" % (e_stepper.stepper.get_commanded_position(), e_stepper.stepper.get_mcu_position(), rd[0], rd[1], e_stepper.stepper.get_step_dist()))
+        return "".join(msg)
+
+    def _format_endstop(self, rail, mcu_endstop, name):
+        return "- %s%s, mcu: %s, pin: %s on: %s\n" % (name, " (virtual)" if rail.is_endstop_virtual(name) else "", mcu_endstop.get_mcu().get_name(), mcu_endstop._pin,
+                                                      ["%d: %s" % (idx, s.get_name()) for idx, s in enumerate(mcu_endstop.get_steppers())])
 
 
 # MMU Kinematics class
 # (loosely based on corexy.py)
 class MmuKinematics:
+    __slots__ = ('printer', 'toolhead', 'mmu_machine', 'rails', 'all_steppers',
+                 'selector_max_velocity', 'selector_max_accel', 'gear_max_velocity', 'gear_max_accel',
+                 'move_accel', 'limits')
+
     def __init__(self, toolhead, config):
         self.printer = config.get_printer()
         self.toolhead = toolhead
@@ -652,6 +668,7 @@ class MmuKinematics:
         self.rails.append(MmuLookupMultiRail(config.getsection(GEAR_STEPPER_CONFIG), need_position_minmax=False, default_position_endstop=0.))
         self.rails[1].setup_itersolve('cartesian_stepper_alloc', b'y')
 
+        self.update_steppers()
         for s in self.get_steppers():
             s.set_trapq(toolhead.get_trapq())
             toolhead.register_step_generator(s.generate_steps)
@@ -662,23 +679,22 @@ class MmuKinematics:
         self.move_accel = None
         self.limits = [(1.0, -1.0)] * len(self.rails)
 
+    # Rebuild cached (immutable) tuple of rail steppers. Must be called whenever steppers are added to or removed from a rail
+    def update_steppers(self):
+        self.all_steppers = tuple(s for rail in self.rails for s in rail.get_steppers())
+
     def get_steppers(self):
-        return [s for rail in self.rails for s in rail.get_steppers()]
+        return self.all_steppers
 
     def calc_position(self, stepper_positions):
-        positions = []
-        for i, r in enumerate(self.rails):
-            #logging.info("MMU: DEBUG: * %d. rail=%s, initial_stepper_name=%s", i, r.get_name(), r.steppers[0].get_name())
-            stepper = None
-            if i == 1:
-                stepper = next((s for s in r.steppers if s not in self.toolhead.inactive_gear_steppers), None)
-            if stepper:
-                positions.append(stepper_positions[stepper.get_name()])
-            elif isinstance(r, DummyRail):
-                positions.append(0.)
-            else:
-                positions.append(stepper_positions[r.get_name()])
-        return positions
+        selector_rail, gear_rail = self.rails
+        # Gear position is taken from the first active gear stepper (falling back to the rail's initial stepper)
+        inactive = self.toolhead.inactive_gear_steppers
+        gear_stepper = next((s for s in gear_rail.steppers if s not in inactive), gear_rail)
+        return [
+            0. if isinstance(selector_rail, DummyRail) else stepper_positions[selector_rail.get_name()],
+            stepper_positions[gear_stepper.get_name()]
+        ]
 
     def set_position(self, newpos, homing_axes):
         for i, rail in enumerate(self.rails):
@@ -695,27 +711,33 @@ class MmuKinematics:
             rail = self.rails[axis]
             position_min, position_max = rail.get_range()
             hi = rail.get_homing_info()
-            homepos = [None, None, None, None]
-            homepos[axis] = hi.position_endstop
-            forcepos = list(homepos)
+            position_endstop = hi.position_endstop
+            homepos = [None] * 4
+            homepos[axis] = position_endstop
+            forcepos = homepos[:]
             if hi.positive_dir:
-                forcepos[axis] -= 1.5 * (hi.position_endstop - position_min)
+                forcepos[axis] = position_endstop - 1.5 * (position_endstop - position_min)
             else:
-                forcepos[axis] += 1.5 * (position_max - hi.position_endstop)
+                forcepos[axis] = position_endstop + 1.5 * (position_max - position_endstop)
             homing_state.home_rails([rail], forcepos, homepos) # Perform homing
 
     def set_accel_limit(self, accel):
         self.move_accel = accel
 
     def check_move(self, move):
-        limits = self.limits
-        xpos, _ = move.end_pos[:2]
-        if xpos != 0. and (xpos < limits[0][0] or xpos > limits[0][1]):
-            raise move.move_error()
-        if move.axes_d[0]: # Selector
-            move.limit_speed(self.selector_max_velocity, min(self.selector_max_accel, self.move_accel or self.selector_max_accel))
-        elif move.axes_d[1]: # Gear
-            move.limit_speed(self.gear_max_velocity, min(self.gear_max_accel, self.move_accel or self.gear_max_accel))
+        xpos = move.end_pos[0]
+        if xpos != 0.:
+            xlo, xhi = self.limits[0]
+            if xpos < xlo or xpos > xhi:
+                raise move.move_error()
+        axes_d = move.axes_d
+        move_accel = self.move_accel
+        if axes_d[0]: # Selector
+            max_accel = self.selector_max_accel
+            move.limit_speed(self.selector_max_velocity, min(max_accel, move_accel or max_accel))
+        elif axes_d[1]: # Gear
+            max_accel = self.gear_max_accel
+            move.limit_speed(self.gear_max_velocity, min(max_accel, move_accel or max_accel))
 
     def get_status(self, eventtime):
         axes = [a for a, (l, h) in zip("xy", self.limits) if l <= h]
@@ -750,15 +772,14 @@ class MmuHoming(Homing, object):
             # Retract
             startpos = self._fill_coord(forcepos)
             homepos = self._fill_coord(movepos)
-            axes_d = [hp - sp for hp, sp in zip(homepos, startpos)]
-            move_d = math.sqrt(sum([d*d for d in axes_d[:3]]))
+            a0, a1, a2, a3 = homepos[0] - startpos[0], homepos[1] - startpos[1], homepos[2] - startpos[2], homepos[3] - startpos[3]
+            move_d = math.sqrt(a0*a0 + a1*a1 + a2*a2)
             retract_r = min(1., hi.retract_dist / move_d)
-            retractpos = [hp - ad * retract_r
-                          for hp, ad in zip(homepos, axes_d)]
+            d0, d1, d2, d3 = a0 * retract_r, a1 * retract_r, a2 * retract_r, a3 * retract_r
+            retractpos = [homepos[0] - d0, homepos[1] - d1, homepos[2] - d2, homepos[3] - d3]
             self.toolhead.move(retractpos, hi.retract_speed)
             # Home again
-            startpos = [rp - ad * retract_r
-                        for rp, ad in zip(retractpos, axes_d)]
+            startpos = [retractpos[0] - d0, retractpos[1] - d1, retractpos[2] - d2, retractpos[3] - d3]
             self.toolhead.set_position(startpos)
             hmove = HomingMove(self.printer, endstops, self.toolhead) # Happy Hare: Override default toolhead
             hmove.homing_move(homepos, hi.second_homing_speed)
@@ -859,11 +880,7 @@ class MmuPrinterRail(stepper.PrinterRail, object):
 
     # Returns the mcu_endstop of given name
     def get_extra_endstop(self, name):
-        matches = [x for x in self.extra_endstops if x[1] == name]
-        if matches:
-            return list(matches)
-        else:
-            return None
+        return [x for x in self.extra_endstops if x[1] == name] or None
 
     def is_endstop_virtual(self, name):
         return name in self.virtual_endstops if name else False
@@ -873,6 +890,8 @@ class MmuPrinterRail(stepper.PrinterRail, object):
             stepper.set_dir_inverted(direction)
 
     class MockEndstop:
+        __slots__ = ()
+
         def add_stepper(self, *args, **kwargs):
             pass
 
@@ -880,11 +899,13 @@ class MmuPrinterRail(stepper.PrinterRail, object):
 # Wrapper for multiple stepper motor support
 def MmuLookupMultiRail(config, need_position_minmax=True, default_position_endstop=None, units_in_radians=False):
     rail = MmuPrinterRail(config, need_position_minmax=need_position_minmax, default_position_endstop=default_position_endstop, units_in_radians=units_in_radians)
+    prefix = config.get_name() + "_"
+    has_section, getsection = config.has_section, config.getsection
     for i in range(1, 23): # Don't allow "_0" or it is confusing with unprefixed initial stepper
-        section_name = "%s_%d" % (config.get_name(), i)
-        if not config.has_section(section_name):
+        section_name = prefix + str(i)
+        if not has_section(section_name):
             break
-        rail.add_extra_stepper(config.getsection(section_name))
+        rail.add_extra_stepper(getsection(section_name))
     return rail
 
 